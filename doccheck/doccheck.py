@@ -1,13 +1,20 @@
 import inspect
-from types import ModuleType
+from types import ModuleType, CodeType
 import sys
-import pkgutil
 import importlib.util
 from pathlib import Path
 import os
-from typing import Any
+from typing import Any, Callable, Iterator
 import re
 import traceback
+import ast
+import functools
+import itertools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import io
 
 
 """
@@ -34,6 +41,301 @@ is it possible to assert that something cause an error
 """
 
 
+# >>exampleN: payload | >>test: payload | >>error: payload, each on its own line
+_DOCCHECK_LINE_RE: re.Pattern[str] = re.compile(r"(?m)^[ \t]*>>(?:example(\d+)|(test|error)):[ \t]*(.*)")
+_BRACKET_OR_NEWLINE_RE: re.Pattern[str] = re.compile(r"[()\[\]{}\n]")
+
+# (kind, example id or None, payload, compiled payload or None if it is not valid python)
+_DocCheckItem = tuple[str, int | None, str, CodeType | None]
+
+_MARKERS: tuple[str, ...] = (">>example", ">>test:", ">>error:")
+_BYTE_MARKERS: tuple[bytes, ...] = tuple(marker.encode("ascii") for marker in _MARKERS)
+
+# Directory entries never walked during module discovery, besides hidden ones
+_SKIPPED_NAMES: frozenset[str] = frozenset({"__pycache__", "venv", "site-packages", "node_modules"})
+
+
+def _has_Marker(text: str) -> bool:
+    """Cheap substring check telling if the text may contain any doccheck line."""
+    return any(marker in text for marker in _MARKERS)
+
+
+def _file_Has_Marker(file_path: str) -> bool:
+    """Tell if a source file may contain any doccheck line, scanning its raw bytes."""
+    try:
+        with open(file_path, "rb") as source_file:
+            data: bytes = source_file.read()
+    except OSError:
+        # Let the import report the problem
+        return True
+    return any(marker in data for marker in _BYTE_MARKERS)
+
+
+# source file path -> (mtime_ns, {class name -> class source}), kept across runs
+_class_sources_cache: dict[str, tuple[int, dict[str, str]]] = {}
+
+
+def _get_Class_Source(class_obj: type) -> str:
+    """
+    Return the source code of a top-level class.
+
+    inspect.getsource re-parses the whole module for every class it is asked about,
+    so each source file is parsed once with ast and every class source is sliced from it.
+    The result is reused until the file modification time changes.
+    """
+    file_path: str | None = getattr(sys.modules.get(class_obj.__module__), "__file__", None)
+    sources: dict[str, str] = {}
+
+    if file_path and file_path.endswith(".py"):
+        mtime_ns: int = os.stat(file_path).st_mtime_ns
+        cached: tuple[int, dict[str, str]] | None = _class_sources_cache.get(file_path)
+
+        if cached is not None and cached[0] == mtime_ns:
+            sources = cached[1]
+        else:
+            with open(file_path, "rb") as source_file:
+                source_bytes: bytes = source_file.read()
+            # decode_source normalizes newlines to \n, the only line break ast counts here;
+            # str.splitlines would also break on form feeds and other separators
+            lines: list[str] = io.StringIO(importlib.util.decode_source(source_bytes)).readlines()
+            for node in ast.parse(source_bytes, filename=file_path).body:
+                if isinstance(node, ast.ClassDef):
+                    first_line: int = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+                    sources[node.name] = "".join(lines[first_line - 1 : node.end_lineno])
+            _class_sources_cache[file_path] = (mtime_ns, sources)
+
+    source: str | None = sources.get(class_obj.__qualname__)
+    if source is None:
+        source = inspect.getsource(class_obj)
+    return source
+
+
+# class -> (class source, extracted doccheck items); weak keys let reloaded classes go away
+_doccheck_items_cache: weakref.WeakKeyDictionary[type, tuple[str, list[_DocCheckItem]]] = weakref.WeakKeyDictionary()
+
+
+def _iter_Py_Modules(pkg_path: str, prefix: str) -> Iterator[tuple[str, str]]:
+    """
+    Yield the dotted name and source file of all modules and subpackages below a package
+    directory, in the same depth-first, name-sorted order as pkgutil.walk_packages.
+
+    Directories are walked with an explicit stack and each one is listed exactly once
+    with os.scandir, whose entries carry the file type read with the listing, so no
+    extra stat call is needed per file.
+    """
+    # (directory path, dotted name, True) for directories, (file path, dotted name, False) for modules
+    stack: list[tuple[str, str, bool]] = [(pkg_path, "", True)]
+
+    while stack:
+        path, dotted_name, is_dir = stack.pop()
+
+        if not is_dir:
+            yield dotted_name, path
+            continue
+
+        with os.scandir(path) as scanned:
+            entries: list[os.DirEntry[str]] = sorted(scanned, key=lambda entry: entry.name)
+
+        child_prefix: str = prefix
+        if dotted_name:
+            # A subdirectory is only walked if it is a regular package
+            if not any(entry.name == "__init__.py" and entry.is_file() for entry in entries):
+                continue
+            yield dotted_name, os.path.join(path, "__init__.py")
+            child_prefix = dotted_name + "."
+
+        children: list[tuple[str, str, bool]] = []
+        for entry in entries:
+            name: str = entry.name
+
+            if name.startswith(".") or name in _SKIPPED_NAMES:
+                continue
+
+            if entry.is_dir(follow_symlinks=False):
+                if name.isidentifier():
+                    children.append((entry.path, child_prefix + name, True))
+
+            elif name.endswith(".py") and name != "__init__.py" and name[:-3].isidentifier():
+                children.append((entry.path, child_prefix + name[:-3], False))
+
+        # Reversed, so the first child is the next one popped
+        stack.extend(reversed(children))
+
+
+def _compile_Excludes(patterns: list[str]) -> list[re.Pattern[str]]:
+    """
+    Compile the --exclude regexes once, before discovery.
+
+    Each pattern is kept separate so its own global flags like (?i) and its backreference numbers still apply.
+    """
+    return [re.compile(pattern) for pattern in patterns]
+
+
+# Errors an import can raise only because another thread was importing a module it needs:
+# a circular import seen partially initialized, or the import lock deadlock detection
+_CONCURRENT_IMPORT_ERRORS: tuple[type[Exception], ...] = (
+    ImportError,
+    getattr(importlib._bootstrap, "_DeadlockError", ImportError),
+)
+
+
+# module name -> mtime_ns of the source file when doccheck last imported it
+_module_mtimes: dict[str, int] = {}
+
+
+def _import_Module_Safely(module_name: str, file_path: str) -> tuple[ModuleType | None, Exception | None]:
+    """
+    Import a module by name, returning the raised error instead of propagating it.
+
+    A module already in sys.modules is reused as is, unless doccheck imported it in
+    a previous run and its source file changed since, in which case it is reloaded.
+    """
+    try:
+        mtime_ns: int = os.stat(file_path).st_mtime_ns
+        module: ModuleType | None = sys.modules.get(module_name)
+        if module is not None and _module_mtimes.get(module_name, mtime_ns) != mtime_ns:
+            module = importlib.reload(module)
+        else:
+            module = importlib.import_module(module_name)
+        _module_mtimes[module_name] = mtime_ns
+        return module, None
+    except Exception as error:
+        return None, error
+
+
+# AST nodes of an expression made only of literals and operators: no names, attributes or calls
+_PURE_NODE_TYPES: tuple[type, ...] = (
+    ast.Expression,
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_Expression(source: str) -> CodeType:
+    """
+    Compile a docstring expression, reusing the code object when the same source recurs.
+
+    Expressions made only of literals and operators are evaluated once here and compiled
+    to their constant result, so evaluating them later is a single constant load.
+    """
+    tree: ast.Expression = ast.parse(source, filename="<doccheck>", mode="eval")
+    code: CodeType = compile(tree, "<doccheck>", "eval")
+
+    if all(isinstance(node, _PURE_NODE_TYPES) for node in ast.walk(tree)):
+        try:
+            value: Any = eval(code, {"__builtins__": {}})
+            folded: ast.Expression = ast.Expression(body=ast.Constant(value=value))
+            return compile(ast.fix_missing_locations(folded), "<doccheck>", "eval")
+        except Exception:
+            # Keep the original code, so the error is raised when the line is evaluated
+            return code
+
+    return code
+
+
+def _try_Compile_Expression(source: str) -> CodeType | None:
+    """Compile ahead of evaluation; None if the source is invalid, so the error is raised when evaluated."""
+    try:
+        return _compile_Expression(source)
+    except Exception:
+        # Not only SyntaxError: a deeply nested expression raises RecursionError or MemoryError
+        return None
+
+
+def _get_Module_Globals(module_name: str, cache: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Return the globals of an imported module, looked up once per module name."""
+    module_globals: dict[str, Any] | None = cache.get(module_name)
+    if module_globals is None:
+        module: ModuleType | None = sys.modules.get(module_name)
+        if module is None:
+            DocCheck._emit(f"Warning: could not find module globals for {module_name}", always=True)
+            module_globals = {}
+        else:
+            module_globals = module.__dict__
+        cache[module_name] = module_globals
+    return module_globals
+
+
+def _build_Eval_Env(class_obj: type, module_globals_cache: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Build the globals used to evaluate the doccheck lines of a class:
+    - module-level globals (imports, constants, etc.)
+    - the class, both as cls and by its own name
+    """
+    module_globals: dict[str, Any] = _get_Module_Globals(class_obj.__module__, module_globals_cache)
+    return {**module_globals, "cls": class_obj, class_obj.__name__: class_obj}
+
+
+def _hash_Test(class_obj: type, kind: str, payload: str) -> str:
+    """Stable key of a test line, used by the persistent cache."""
+    return hashlib.sha1(f"{class_obj.__qualname__}:{kind}:{payload}".encode("utf-8")).hexdigest()
+
+
+def _file_State(file_path: str) -> list[int]:
+    """Return [mtime_ns, size] of a file, or [-1, -1] if it cannot be read."""
+    try:
+        file_stat: os.stat_result = os.stat(file_path)
+    except OSError:
+        return [-1, -1]
+    return [file_stat.st_mtime_ns, file_stat.st_size]
+
+
+def _project_Module_States(root_dir: str) -> dict[str, list[int]]:
+    """
+    Return the [mtime_ns, size] of every loaded module whose source lies under root_dir.
+
+    Tests evaluate against other project modules too, so a cached pass is only valid
+    while none of them changed, not just the file defining the tested class.
+    """
+    root_prefix: str = os.path.join(os.path.abspath(root_dir), "")
+    states: dict[str, list[int]] = {}
+
+    for module in list(sys.modules.values()):
+        file_path: str | None = getattr(module, "__file__", None)
+        if not file_path:
+            continue
+        file_path = os.path.abspath(file_path)
+        if file_path.startswith(root_prefix):
+            states[file_path] = _file_State(file_path)
+
+    return states
+
+
+def _load_Cache_Index(index_path: str) -> dict[str, dict[str, Any]]:
+    """Load the persistent cache index, or an empty one if it is missing or unreadable."""
+    try:
+        with open(index_path, encoding="utf-8") as index_file:
+            index: Any = json.load(index_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    # Drop malformed entries instead of failing on them later
+    return {
+        file_path: entry
+        for file_path, entry in index.items()
+        if isinstance(entry, dict) and isinstance(entry.get("modules"), dict) and isinstance(entry.get("passed"), list)
+    }
+
+
+def _save_Cache_Index(index_path: str, index: dict[str, dict[str, Any]]) -> None:
+    """Write the persistent cache index, a failure only costs the cache."""
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path, "w", encoding="utf-8") as index_file:
+            json.dump(index, index_file, indent=1)
+    except OSError as err:
+        DocCheck._emit(f"Warning: could not write doccheck cache {index_path}: {err}", always=True)
+
+
 class DocCheck:
     """
     A tool to scan a python project for embedded test conditions in docstrings
@@ -48,6 +350,35 @@ class DocCheck:
 
     excludes: list[str] = []
 
+    # Import project modules from a thread pool; off by default, since module top-level code
+    # such as signal.signal only works on the main thread
+    parallel_imports: bool = False
+
+    # Output is buffered and written once at the end of run; verbose False keeps only failures and warnings
+    verbose: bool = True
+    _log: list[str] = []
+
+    # (module name, error) of every module that could not be imported during the last run
+    _errors: list[tuple[str, Exception]] = []
+
+    # Persistent cache of passed tests, valid while no loaded project module changed
+    use_cache: bool = True
+    cache_dir: str = ".doccheck_cache"
+
+    @classmethod
+    def _emit(cls, message: str, always: bool = False) -> None:
+        """Buffer one line of output, dropped when not verbose unless always is set."""
+        if always or cls.verbose:
+            cls._log.append(message)
+
+    @classmethod
+    def _flush_Log(cls) -> None:
+        """Write all buffered output with a single call."""
+        if cls._log:
+            sys.stdout.write("\n".join(cls._log) + "\n")
+            sys.stdout.flush()
+            cls._log = []
+
     @classmethod
     def load_Root_Package_From_Path(cls, project_path: str) -> None:
         """Load the root package module object from a filesystem path."""
@@ -68,180 +399,206 @@ class DocCheck:
         try:
             # Import the package
             cls.root_package = importlib.import_module(package_name)
-            print(f"Succesfully imported root module: {package_name}")
+            cls._emit(f"Succesfully imported root module: {package_name}")
         except Exception as err:
-            print(f"Error while importing root module {package_name}: {err}")
-            sys.exit(1)
+            cls._emit(f"Error while importing root module {package_name}: {err}", always=True)
+            cls.root_package = None
+            cls._errors.append((package_name, err))
 
     @classmethod
     def find_All_Python_Classes_From_Root_Module(cls) -> None:
         """Find all modules of a project from a root module"""
 
+        module_names: list[str] = []
+        file_paths: list[str] = []
+        exclude_patterns: list[re.Pattern[str]] = _compile_Excludes(cls.excludes)
+
         # Walk through the package hierarchy
-        for module_info in pkgutil.walk_packages(cls.root_package.__path__, cls.root_package.__name__ + "."):
+        for module_name, file_path in _iter_Py_Modules(cls.root_package.__path__[0], cls.root_package.__name__ + "."):
 
             # -----------------------------------------------------
             # EXCLUSION FILTER (regex patterns specified via --exclude)
             # -----------------------------------------------------
-            if any(re.search(pattern, module_info.name) for pattern in cls.excludes):
-                print(f"Skipping module {module_info.name} (excluded by regex)")
+            if any(pattern.search(module_name) for pattern in exclude_patterns):
+                cls._emit(f"Skipping module {module_name} (excluded by regex)")
                 continue
             # -----------------------------------------------------
 
-            try:
-                print(f"Attempting to load module: {module_info.name}")
-                module = importlib.import_module(module_info.name)
-                print(f"Module {module_info.name} imported correctly.\n Now attempting to load classes:")
-                cls.modules_list.append(module)
+            # Modules without any doccheck line have nothing to test, so they are not even imported
+            if not _file_Has_Marker(file_path):
+                cls._emit(f"Skipping module {module_name} (no doccheck lines)")
+                continue
 
-                # Collect all classes defined in the current module (not imported)
-                for _, class_obj in inspect.getmembers(module, inspect.isclass):
-                    print(f"Attempting to import class: {class_obj} ...")
+            module_names.append(module_name)
+            file_paths.append(file_path)
 
-                    if not inspect.isclass(class_obj):
-                        print(f"Error: impossible to load class {class_obj}: it's not a class")
-                        sys.exit(1)
+        import_results: list[tuple[ModuleType | None, Exception | None]]
+        if cls.parallel_imports:
+            # Imports spend much of their time on file I/O and bytecode loading, which overlaps
+            # well across threads, but module top-level code then runs outside the main thread
+            max_workers: int = min(32, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                import_results = list(executor.map(_import_Module_Safely, module_names, file_paths))
+        else:
+            import_results = [_import_Module_Safely(module_name, file_path) for module_name, file_path in zip(module_names, file_paths)]
 
-                    if class_obj.__module__.lower() != module_info.name.lower():
-                        # print(f"Skipped: impossible to load class {class_obj}: class module is different from package name: {module_info.name}")
-                        continue
+        # Class discovery mutates the class level lists, so it runs serially in walk order
+        for module_name, file_path, (module, error) in zip(module_names, file_paths, import_results):
+            cls._emit(f"Attempting to load module: {module_name}")
+
+            if cls.parallel_imports and isinstance(error, _CONCURRENT_IMPORT_ERRORS):
+                # A circular import can fail or deadlock when run concurrently, retry it alone;
+                # any other error is real, and retrying would run the module top-level code twice
+                module, error = _import_Module_Safely(module_name, file_path)
 
-                    print(f"Succesfully loaded class {class_obj}")
-                    cls.classes_list.append(class_obj)
+            if error is not None:
+                cls._emit(f"Error: impossible to load module {module_name}: {repr(error)}", always=True)
+                cls._emit("".join(traceback.format_exception(type(error), error, error.__traceback__)), always=True)
+                cls._errors.append((module_name, error))
+                continue
 
-            except Exception as error:
-                print(f"Error: impossible to load module {module_info.name}: {repr(error)}")
-                traceback.print_exc()
-                sys.exit(1)
+            cls._emit(f"Module {module_name} imported correctly.\n Now attempting to load classes:")
+            cls.modules_list.append(module)
+
+            # Collect all classes defined in the current module (not imported)
+            for class_obj in vars(module).values():
+                if not isinstance(class_obj, type):
+                    continue
+
+                cls._emit(f"Attempting to import class: {class_obj} ...")
+
+                if class_obj.__module__ != module_name:
+                    # print(f"Skipped: impossible to load class {class_obj}: class module is different from package name: {module_name}")
+                    continue
+
+                cls._emit(f"Succesfully loaded class {class_obj}")
+                cls.classes_list.append(class_obj)
 
     @classmethod
     def load_Classes_Docstrings(cls) -> None:
-        """Create in each class a new variable named _docstrings as list[str]"""
+        """
+        Create in each class a new variable named _doccheck_items as list[tuple[kind, example_id, payload, code]],
+        holding only the doccheck lines of its docstrings, already classified and compiled.
+        """
 
-        def safe_Splitlines_Preserving_Parentheses(text: str) -> list[str]:
+        def join_Lines_Inside_Brackets(text: str) -> str:
             """
-            Split text into lines, but do not split when the newline occurs inside
-            (), [] or {}. This handles nesting without regex.
+            Replace with a space every newline that occurs inside (), [] or {}, so each
+            logical line ends up on a single physical line. Only brackets and newlines
+            are visited, everything in between is copied as a whole slice.
             """
 
-            result_chars: list[str] = []
+            segments: list[str] = []
             paren_depth: int = 0
             bracket_depth: int = 0
             brace_depth: int = 0
-
-            # Walk each character; when inside any brackets, convert newline to space.
-            for ch in text:
-                if ch == "(":
+            segment_start: int = 0
+
+            for match in _BRACKET_OR_NEWLINE_RE.finditer(text):
+                ch: str = match.group()
+                if ch == "\n":
+                    if paren_depth > 0 or bracket_depth > 0 or brace_depth > 0:
+                        # Keep the content continuous when inside any bracket type
+                        segments.append(text[segment_start : match.start()])
+                        segments.append(" ")
+                        segment_start = match.end()
+                elif ch == "(":
                     paren_depth += 1
-                    result_chars.append(ch)
-                    continue
-                if ch == ")":
+                elif ch == ")":
                     paren_depth = max(0, paren_depth - 1)
-                    result_chars.append(ch)
-                    continue
-                if ch == "[":
+                elif ch == "[":
                     bracket_depth += 1
-                    result_chars.append(ch)
-                    continue
-                if ch == "]":
+                elif ch == "]":
                     bracket_depth = max(0, bracket_depth - 1)
-                    result_chars.append(ch)
-                    continue
-                if ch == "{":
+                elif ch == "{":
                     brace_depth += 1
-                    result_chars.append(ch)
-                    continue
-                if ch == "}":
+                else:
                     brace_depth = max(0, brace_depth - 1)
-                    result_chars.append(ch)
-                    continue
 
-                if ch == "\n" and (paren_depth > 0 or bracket_depth > 0 or brace_depth > 0):
-                    # Keep the content continuous when inside any bracket type
-                    result_chars.append(" ")
-                else:
-                    result_chars.append(ch)
+            segments.append(text[segment_start:])
 
-            merged_text: str = "".join(result_chars)
+            return "".join(segments)
 
-            # Standard split; also strip and drop empty lines
-            logical_lines: list[str] = []
-            for raw_line in merged_text.splitlines():
-                logical_lines.append(raw_line)
+        def iter_Docstring_Blocks(source_code: str) -> Iterator[str]:
+            """Yield each docstring block of a class source that may hold doccheck lines, one logical line per line."""
 
-            return logical_lines
+            if not _has_Marker(source_code):
+                return
 
-        for class_instance in cls.classes_list:
-            tmp_list: list[str] = []
+            inline_doc_blocks: list[str] = re.findall(r'"""(.*?)"""', source_code, flags=re.DOTALL)
 
-            source_code: str = inspect.getsource(class_instance)
+            for block in inline_doc_blocks:
 
-            source_code = source_code.replace("{", "⦃")  # LEFT WHITE CURLY BRACKET (U+2983)
-            source_code = source_code.replace("}", "⦄")  # RIGHT WHITE CURLY BRACKET (U+2984)
-            source_code = source_code.replace("[", "⟦")
-            source_code = source_code.replace("]", "⟧")
-            source_code = source_code.replace("(", "⟮")
-            source_code = source_code.replace(")", "⟯")
+                if not _has_Marker(block):
+                    continue
 
-            inline_doc_blocks: list[str] = re.findall(r'"""(.*?)"""', source_code, flags=re.DOTALL)
+                yield join_Lines_Inside_Brackets(block)
 
-            for block in inline_doc_blocks:
+        for class_instance in cls.classes_list:
+            source_code: str = _get_Class_Source(class_instance)
+
+            # Reuse the items extracted by a previous run if the class source did not change
+            cached: tuple[str, list[_DocCheckItem]] | None = _doccheck_items_cache.get(class_instance)
+            if cached is not None and cached[0] == source_code:
+                items: list[_DocCheckItem] = cached[1]
 
-                block = block.replace("⦃", "{")  # LEFT WHITE CURLY BRACKET (U+2983)
-                block = block.replace("⦄", "}")  # RIGHT WHITE CURLY BRACKET (U+2984)
-                block = block.replace("⟦", "[")
-                block = block.replace("⟧", "]")
-                block = block.replace("⟮", "(")
-                block = block.replace("⟯", ")")
+            else:
+                items = []
+                blocks: Iterator[str] = iter_Docstring_Blocks(source_code)
 
-                tmp_list.extend(safe_Splitlines_Preserving_Parentheses(block))
+                for match in itertools.chain.from_iterable(map(_DOCCHECK_LINE_RE.finditer, blocks)):
+                    payload: str = match.group(3)
+                    code: CodeType | None = _try_Compile_Expression(payload)
 
-            setattr(class_instance, "_docstrings", tmp_list.copy())
-            print(f"Found {len(tmp_list)} docstring lines for class {class_instance.__name__}")
+                    if match.group(1) is not None:
+                        items.append(("example", int(match.group(1)), payload, code))
+                    else:
+                        items.append((match.group(2), None, payload, code))
+
+                _doccheck_items_cache[class_instance] = (source_code, items)
+
+            setattr(class_instance, "_doccheck_items", items)
+            cls._emit(f"Found {len(items)} doccheck lines for class {class_instance.__name__}")
 
     @classmethod
     def load_Classes_Examples(cls) -> bool:
         """Load for each class the example variables"""
-        for class_instance in cls.classes_list:
-
-            for doc in class_instance._docstrings:
+        module_globals_cache: dict[str, dict[str, Any]] = {}
+        # Success messages are not even formatted when they would be dropped
+        verbose: bool = cls.verbose
+        emit: Callable[..., None] = cls._emit
 
-                if ">>example" in doc:
-
-                    match = re.search(r">>example(\d+):", doc)
-                    if not match:
-                        print(f"Error: example number regex match failed in class: {class_instance} and doc: {doc}")
-                        sys.exit(1)
+        for class_instance in cls.classes_list:
 
-                    example_id: int = int(match.group(1))
+            if not class_instance._doccheck_items:
+                continue
 
-                    payload: str = re.split(r">>example\d*:", doc, maxsplit=1)[-1].strip()
+            class_name: str = class_instance.__name__
 
-                    # Prepare a safe evaluation context
-                    module_globals: dict[str, Any] = {}
-                    try:
-                        module_globals = sys.modules[class_instance.__module__].__dict__
-                    except KeyError:
-                        print(f"Warning: could not find module globals for {class_instance.__module__}")
+            # Prepare a safe evaluation context, once per class, shared with run_Classes_Tests
+            eval_env: dict[str, Any] = _build_Eval_Env(class_instance, module_globals_cache)
+            setattr(class_instance, "__doccheck_env__", eval_env)
 
-                    # Safe eval environment includes:
-                    # - the class
-                    # - module-level globals (imports, constants, etc.)
-                    # - common useful builtins if missing
-                    eval_env: dict[str, Any] = {"cls": class_instance, class_instance.__name__: class_instance, **module_globals}
+            for kind, example_id, payload, code in class_instance._doccheck_items:
 
-                    try:
-                        example_object = eval(payload, eval_env)
-                        setattr(class_instance, f"example{example_id}", example_object)
-                        print(f"Loaded example{example_id} for class {class_instance.__name__}: payload: {doc}\nSUCCESS: True")
-                    except Exception as error:
-                        print(
-                            f"Error while evaluating example{example_id} for class {class_instance.__name__}: {error=} {doc=}\nSUCCESS: False"
-                        )
-                        return False
-                    print("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n")
+                if kind != "example":
+                    continue
 
+                try:
+                    example_object = eval(code if code is not None else _compile_Expression(payload), eval_env)
                     setattr(class_instance, f"example{example_id}", example_object)
+                    if verbose:
+                        emit(f"Loaded example{example_id} for class {class_name}: payload: {payload}\nSUCCESS: True")
+                except Exception as error:
+                    emit(
+                        f"Error while evaluating example{example_id} for class {class_name}: {error=} {payload=}\nSUCCESS: False",
+                        always=True,
+                    )
+                    return False
+                if verbose:
+                    emit("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n")
+
+                setattr(class_instance, f"example{example_id}", example_object)
         return True
 
     @classmethod
@@ -249,80 +606,146 @@ class DocCheck:
 
         result: bool = True
         test_processed: int = 0
+        module_globals_cache: dict[str, dict[str, Any]] = {}
+        # Success messages are not even formatted when they would be dropped
+        verbose: bool = cls.verbose
+        emit: Callable[..., None] = cls._emit
+
+        index_path: str = os.path.join(cls.cache_dir, "index.json")
+        cache_index: dict[str, dict[str, Any]] = _load_Cache_Index(index_path) if cls.use_cache else {}
+        project_dir: str = cls.root_package.__path__[0]
+        # file path -> (modules recorded in the previous run if still valid, hashes passed in the previous run,
+        # hashes passed in this run)
+        file_states: dict[str, tuple[dict[str, list[int]], set[str], set[str]]] = {}
 
         for class_instance in cls.classes_list:
 
-            for doc in class_instance._docstrings:
-                if ">>test:" in doc or ">>error:" in doc:
-                    test_processed += 1
+            if not class_instance._doccheck_items:
+                continue
+
+            class_name: str = class_instance.__name__
+
+            # Reuse the evaluation context built while loading examples; read from the class
+            # __dict__ so a subclass never picks up the context of its parent
+            eval_env: dict[str, Any] | None = vars(class_instance).get("__doccheck_env__")
+            if eval_env is None:
+                eval_env = _build_Eval_Env(class_instance, module_globals_cache)
+
+            # Tests that passed in the previous run are skipped if no project module changed since
+            cached_hashes: set[str] = set()
+            passed_hashes: set[str] = set()
+            file_path: str | None = getattr(sys.modules.get(class_instance.__module__), "__file__", None)
+            if cls.use_cache and file_path:
+                if file_path not in file_states:
+                    entry: dict[str, Any] = cache_index.get(file_path, {})
+                    # Modules recorded with the entry may not be imported yet, so stat them directly
+                    unchanged: bool = bool(entry) and all(
+                        _file_State(module_path) == state for module_path, state in entry["modules"].items()
+                    )
+                    if unchanged:
+                        file_states[file_path] = (entry["modules"], set(entry["passed"]), set())
+                    else:
+                        file_states[file_path] = ({}, set(), set())
+                _, cached_hashes, passed_hashes = file_states[file_path]
+
+            for kind, _, payload, code in class_instance._doccheck_items:
+
+                if kind == "example":
+                    continue
 
-                    payload = doc.split(">>test:")[-1]
-                    payload = payload.split(">>error:")[-1]
+                test_processed += 1
+
+                test_hash: str = _hash_Test(class_instance, kind, payload)
+                if test_hash in cached_hashes:
+                    passed_hashes.add(test_hash)
+                    if verbose:
+                        emit(f"Skipped test in class {class_name}, payload: {payload}\nPASSED: True (cached)")
+                    continue
 
-                    print(f"{payload=}")
+                if verbose:
+                    emit(f"{payload=}")
 
-                    # Prepare a safe evaluation context
-                    module_globals: dict[str, Any] = {}
+                if kind == "test":
                     try:
-                        module_globals = sys.modules[class_instance.__module__].__dict__
-                    except KeyError:
-                        print(f"Warning: could not find module globals for {class_instance.__module__}")
-
-                    # Safe eval environment includes:
-                    # - the class
-                    # - module-level globals (imports, constants, etc.)
-                    # - common useful builtins if missing
-                    eval_env: dict[str, Any] = {"cls": class_instance, class_instance.__name__: class_instance, **module_globals}
-
-                    if ">>test:" in doc:
-                        try:
-                            test_result = eval(payload, eval_env)
-                            print(f"Executed test in class {class_instance.__name__}, payload: {payload}\nPASSED: {test_result}")
-                            result = result and test_result
-                            if test_result is False:
-                                print("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n")
-
-                        except Exception as error:
-                            print(f"Error while evaluating test {payload} for class {class_instance.__name__}: {error}\nPASSED: False")
-                            result = False
-                            print("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n")
-
-                    elif ">>error:" in doc:
-                        try:
-                            test_result = eval(payload, eval_env)
-                            print(
-                                f"Error while evaluating error test {payload} for class {class_instance.__name__}: no error trown\nPASSED: False"
-                            )
-                            result = False
-                            print("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n")
-
-                        except Exception as err:
-                            print(f"Executed error test in class {class_instance.__name__}, payload: {payload}\nPASSED: True")
+                        test_result = eval(code if code is not None else _compile_Expression(payload), eval_env)
+                        test_passed: bool = bool(test_result)
+                    except Exception as error:
+                        emit(f"Error while evaluating test {payload} for class {class_name}: {error}\nPASSED: False", always=True)
+                        result = False
+                        emit("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n", always=True)
+                        continue
+
+                    if test_passed:
+                        passed_hashes.add(test_hash)
+                        if verbose:
+                            emit(f"Executed test in class {class_name}, payload: {payload}\nPASSED: {test_result}")
+                    else:
+                        result = False
+                        emit(f"Executed test in class {class_name}, payload: {payload}\nPASSED: {test_result}", always=True)
+                        emit("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n", always=True)
+
+                else:
+                    try:
+                        test_result = eval(code if code is not None else _compile_Expression(payload), eval_env)
+                        emit(
+                            f"Error while evaluating error test {payload} for class {class_name}: no error trown\nPASSED: False",
+                            always=True,
+                        )
+                        result = False
+                        emit("!!!!!!!!!!!\n!!!!!!!!!!!\n!!!!!!!!!!!\n", always=True)
+
+                    except Exception as err:
+                        passed_hashes.add(test_hash)
+                        if verbose:
+                            emit(f"Executed error test in class {class_name}, payload: {payload}\nPASSED: True")
+
+        if cls.use_cache:
+            # Modules imported while evaluating are part of the state the results depend on
+            module_states: dict[str, list[int]] = _project_Module_States(project_dir)
+            for file_path, (recorded_states, _, passed) in file_states.items():
+                # Skipped tests did not import their dependencies, keep the ones recorded for them
+                cache_index[file_path] = {"modules": {**recorded_states, **module_states}, "passed": sorted(passed)}
+            _save_Cache_Index(index_path, cache_index)
 
         if test_processed > 0:
             return result
         else:
-            print("Error: to use doccheck at least one test must pass")
+            cls._emit("Error: to use doccheck at least one test must pass", always=True)
             return False
 
     @classmethod
     def run(cls, path: str) -> bool:
         """Return if all tests passed"""
+        DocCheck._errors = []
+        DocCheck.modules_list = []
+        DocCheck.classes_list = []
+        DocCheck._log = []
+        try:
+            # A project module that could not be imported fails the run, even if every loaded test passed
+            return DocCheck._run_Phases(path) and not DocCheck._errors
+        finally:
+            DocCheck._flush_Log()
+
+    @classmethod
+    def _run_Phases(cls, path: str) -> bool:
+        """Run every phase in order, stopping at the first one that fails"""
         DocCheck.load_Root_Package_From_Path(path)
-        print("\n")
+        if DocCheck.root_package is None:
+            return False
+        DocCheck._emit("\n")
         DocCheck.find_All_Python_Classes_From_Root_Module()
-        print("\n")
+        DocCheck._emit("\n")
         DocCheck.load_Classes_Docstrings()
-        print("\n")
+        DocCheck._emit("\n")
         res = DocCheck.load_Classes_Examples()
         if res is False:
             return False
-        print("\n")
+        DocCheck._emit("\n")
         return DocCheck.run_Classes_Tests()
 
 
 def main() -> None:
-    """Entry point for the DocCheck CLI with --exclude support."""
+    """Entry point for the DocCheck CLI with --exclude, --no-cache, --quiet and --parallel-imports support."""
     raw_args = sys.argv[1:]
 
     path: str | None = None
@@ -331,8 +754,14 @@ def main() -> None:
     # Parse arguments
     for arg in raw_args:
         if arg.startswith("--exclude="):
-            pattern = arg.split("=", 1)[1]
+            _, _, pattern = arg.partition("=")
             exclude_patterns.append(pattern)
+        elif arg == "--no-cache":
+            DocCheck.use_cache = False
+        elif arg == "--quiet":
+            DocCheck.verbose = False
+        elif arg == "--parallel-imports":
+            DocCheck.parallel_imports = True
         else:
             path = arg
 
@@ -349,6 +778,11 @@ def main() -> None:
 
     result: bool = DocCheck.run(path)
 
+    if DocCheck._errors:
+        print(f"{len(DocCheck._errors)} module(s) could not be loaded:")
+        for module_name, error in DocCheck._errors:
+            print(f"  {module_name}: {repr(error)}")
+
     print(f"returning test result: {result}")
 
     sys.exit(0 if result else 1)